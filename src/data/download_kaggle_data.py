@@ -15,15 +15,26 @@ Before running this script, you need to set up Kaggle API credentials:
 
 import os
 import sys
+import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
 
+try:
+    from isal import isal_zlib
+except ImportError:  # Optional: pip install isal
+    isal_zlib = None
+
 def check_kaggle_credentials():
     """Check if Kaggle credentials are configured."""
     kaggle_dir = Path.home() / ".kaggle"
     kaggle_json = kaggle_dir / "kaggle.json"
     
-    if not kaggle_json.exists():
+    # A single stat() both checks existence and reads the permissions
+    try:
+        mode = kaggle_json.stat().st_mode
+    except (FileNotFoundError, NotADirectoryError):
         print("=" * 70)
         print("ERROR: Kaggle credentials not found!")
         print("=" * 70)
@@ -42,13 +53,66 @@ def check_kaggle_credentials():
         return False
     
     # Check permissions
-    if os.stat(kaggle_json).st_mode & 0o077 != 0:
+    if mode & 0o077 != 0:
         print("WARNING: kaggle.json has incorrect permissions.")
         print(f"Run: chmod 600 {kaggle_json}")
         return False
     
     return True
 
+@contextmanager
+def fast_inflate():
+    """Make zipfile inflate with ISA-L instead of zlib, if isal is installed.
+    
+    isal_zlib is a drop-in replacement for the zlib calls zipfile makes and
+    decompresses DEFLATE members several times faster. Yields whether it is
+    active; zipfile is restored on exit.
+    """
+    if isal_zlib is None:
+        yield False
+        return
+    saved = zipfile.zlib, zipfile.crc32
+    zipfile.zlib, zipfile.crc32 = isal_zlib, isal_zlib.crc32
+    try:
+        yield True
+    finally:
+        zipfile.zlib, zipfile.crc32 = saved
+
+def extract_zip(zip_file, data_dir, max_workers=None):
+    """Extract a zip archive, decompressing its members in parallel threads."""
+    with zipfile.ZipFile(zip_file, 'r') as zip_ref:
+        members = zip_ref.infolist()
+        files = [m for m in members if not m.is_dir()]
+        
+        # Create every directory up front so worker threads never race on makedirs
+        for member in members:
+            if member.is_dir():
+                zip_ref.extract(member, data_dir)
+        for member in files:
+            parts = [p for p in Path(member.filename).parent.parts if p not in ('', '.', '..', '/')]
+            data_dir.joinpath(*parts).mkdir(parents=True, exist_ok=True)
+    
+    # Members of one ZipFile share a file object whose seek+read is serialized
+    # behind a lock, so each worker thread opens its own handle on the archive
+    local = threading.local()
+    handles = []
+    
+    def extract_member(member):
+        worker_zip = getattr(local, 'zip_ref', None)
+        if worker_zip is None:
+            worker_zip = local.zip_ref = zipfile.ZipFile(zip_file, 'r')
+            handles.append(worker_zip)
+        worker_zip.extract(member, data_dir)
+    
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            futures = [executor.submit(extract_member, member) for member in files]
+            for future in as_completed(futures):
+                future.result()
+    finally:
+        for handle in handles:
+            handle.close()
+
 def download_competition_data():
     """Download data from Kaggle competition."""
     # Check credentials first before importing kaggle (which tries to authenticate on import)
@@ -81,12 +145,14 @@ def download_competition_data():
         # Unzip all zip files in the directory
         print("\nExtracting zip files...")
         zip_files = list(data_dir.glob("*.zip"))
-        for zip_file in zip_files:
-            print(f"  Extracting {zip_file.name}...")
-            with zipfile.ZipFile(zip_file, 'r') as zip_ref:
-                zip_ref.extractall(data_dir)
-            # Optionally remove the zip file after extraction
-            # zip_file.unlink()
+        with fast_inflate() as using_isal:
+            if using_isal:
+                print("  Using ISA-L for decompression")
+            for zip_file in zip_files:
+                print(f"  Extracting {zip_file.name}...")
+                extract_zip(zip_file, data_dir)
+                # Optionally remove the zip file after extraction
+                # zip_file.unlink()
         
         print("\n" + "=" * 70)
         print("SUCCESS: Data downloaded and extracted successfully!")
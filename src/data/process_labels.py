@@ -8,31 +8,85 @@ This script:
 3. Saves to data/processed/y_train.parquet
 """
 
+import argparse
+import csv
+import gzip
+import os
 import sys
 from pathlib import Path
-import pandas as pd
+import numpy as np
+import pyarrow as pa
+from pyarrow import csv as pacsv, parquet as papq
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from src.utils.file_utils import atomic_output, checksum_ok, source_fingerprint
+
+# Block size of the streaming Arrow CSV reader; one block of CSV text is in memory at a time
+CSV_BLOCK_SIZE = 32 << 20
+
+# Two distinct values: skip the dictionary and let V2 pages RLE/bit-pack them
+LABELS_WRITE_OPTIONS = dict(compression='snappy', use_dictionary=False,
+                            data_page_version='2.0', write_statistics=True)
+
 def find_labels_file():
     """Find the train labels file."""
     possible_locations = [
-        project_root / "data" / "external" / "train_labels.csv",
         project_root / "data" / "external" / "train_labels.csv",
         project_root / "data" / "raw" / "train_labels.csv",
         project_root / "data" / "raw" / "train_labels.csv.gz",
     ]
     
+    # List each directory once instead of a stat() per candidate
+    listings = {}
     for path in possible_locations:
-        if path.exists():
+        if path.parent not in listings:
+            try:
+                listings[path.parent] = {entry.name for entry in os.scandir(path.parent)}
+            except (FileNotFoundError, NotADirectoryError):
+                listings[path.parent] = set()
+        if path.name in listings[path.parent]:
             return path
     
     return None
 
-def process_labels():
+def open_labels_file(labels_file):
+    """Open the labels file as an Arrow input stream, decompressing gzip on the fly."""
+    source = pa.OSFile(str(labels_file), 'rb')
+    if labels_file.suffix == '.gz':
+        return pa.CompressedInputStream(source, 'gzip')
+    return source
+
+def read_labels_header(labels_file):
+    """Read only the header row of the labels file."""
+    opener = gzip.open if labels_file.suffix == '.gz' else open
+    with opener(labels_file, 'rt', newline='') as f:
+        return next(csv.reader(f), [])
+
+def block_value_counts(values):
+    """Return the distinct values of a block and their counts, and whether it is 0/1 only."""
+    if np.isin(values, [0, 1]).all():
+        # Known 0/1 values: one histogram pass instead of a sort
+        return np.array([0.0, 1.0]), np.bincount(values.astype(np.int8), minlength=2), True
+    unique_vals, counts = np.unique(values, return_counts=True)
+    return unique_vals, counts, False
+
+def merge_value_counts(blocks):
+    """Combine per-block (values, counts) pairs into overall distinct values and counts."""
+    if not blocks:
+        return [], np.zeros(0, dtype=np.int64)
+    unique_vals, inverse = np.unique(np.concatenate([v for v, _ in blocks]), return_inverse=True)
+    counts = np.bincount(inverse, weights=np.concatenate([c for _, c in blocks])).astype(np.int64)
+    present = counts > 0
+    return unique_vals[present].tolist(), counts[present]
+
+def process_labels(force=False):
     """Process train labels and save to processed folder."""
+    processed_dir = project_root / "data" / "processed"
+    labels_path = processed_dir / "y_train.parquet"
+    
     # Find labels file
     labels_file = find_labels_file()
     
@@ -51,29 +105,22 @@ def process_labels():
     
     print(f"Found labels file: {labels_file}")
     
-    # Load labels
-    print("Loading labels...")
-    if labels_file.suffix == '.gz':
-        labels_df = pd.read_csv(labels_file, compression='gzip')
-    else:
-        labels_df = pd.read_csv(labels_file)
-    
-    print(f"Labels shape: {labels_df.shape}")
-    print(f"Columns: {list(labels_df.columns)}")
+    # Identify target column from the header so only that column gets parsed
+    columns = read_labels_header(labels_file)
+    print(f"Columns: {columns}")
     
-    # Identify target column
     target_col = None
     for col in ['target', 'default', 'label']:
-        if col in labels_df.columns:
+        if col in columns:
             target_col = col
             break
     
     if target_col is None:
         # Assume first column after customer_ID is the target
-        if 'customer_ID' in labels_df.columns:
-            target_col = labels_df.columns[1] if len(labels_df.columns) > 1 else None
+        if 'customer_ID' in columns:
+            target_col = columns[1] if len(columns) > 1 else None
         else:
-            target_col = labels_df.columns[0]
+            target_col = columns[0] if columns else None
     
     if target_col is None:
         print("ERROR: Could not identify target column in labels file")
@@ -81,32 +128,83 @@ def process_labels():
     
     print(f"Target column: '{target_col}'")
     
-    # Extract target
-    y = labels_df[target_col].copy()
+    # An output built by this script from the same labels file and column
+    # makes this a no-op; process_train_data writes a y_train of its own
+    inputs = {
+        'script': 'process_labels',
+        'labels_file': source_fingerprint(labels_file),
+        'target': target_col,
+    }
+    if not force and checksum_ok(labels_path, inputs):
+        print(f"Labels already processed: {labels_path} (checksum and inputs verified)")
+        print("Run with --force to rebuild them.")
+        return True
     
-    # Verify it's binary
-    unique_vals = sorted(y.unique())
-    print(f"Unique values: {unique_vals}")
-    print(f"Value counts:\n{y.value_counts().sort_index()}")
-    print(f"Class distribution:\n{y.value_counts(normalize=True).sort_index()}")
+    processed_dir.mkdir(parents=True, exist_ok=True)
     
-    if not set(unique_vals).issubset({0, 1, 0.0, 1.0}):
-        print("WARNING: Target column is not binary (0/1)")
+    # Parse the target block by block as float64, which accepts both 0/1 and
+    # 0.0/1.0 codes, skipping the customer_ID strings entirely. Each block is
+    # written out as soon as it is parsed; only its value counts are kept
+    print("Loading labels...")
+    read_options = pacsv.ReadOptions(use_threads=True, block_size=CSV_BLOCK_SIZE)
+    convert_options = pacsv.ConvertOptions(
+        column_types={target_col: pa.float64()},
+        include_columns=[target_col],
+    )
+    schema = pa.schema([('target', pa.float64())])
+    n_rows = 0
+    is_binary = True
+    blocks = []
+    try:
+        with atomic_output(labels_path, inputs) as tmp_path:
+            with open_labels_file(labels_file) as src, \
+                    papq.ParquetWriter(tmp_path, schema, **LABELS_WRITE_OPTIONS) as writer:
+                reader = pacsv.open_csv(src, read_options=read_options, convert_options=convert_options)
+                for batch in reader:
+                    writer.write_table(pa.Table.from_batches([batch.rename_columns(['target'])]))
+                    n_rows += batch.num_rows
+                    unique_vals, counts, block_binary = block_value_counts(batch.column(0).drop_null().to_numpy())
+                    blocks.append((unique_vals, counts))
+                    is_binary = is_binary and block_binary
+            if is_binary:
+                # A 0/1 target is stored as int8: re-encode the finished file,
+                # which is small next to the CSV it came from
+                target = papq.read_table(tmp_path).column('target').cast(pa.int8())
+                papq.write_table(pa.table({'target': target}), tmp_path, **LABELS_WRITE_OPTIONS)
+    except pa.ArrowInvalid as e:
+        print(f"ERROR: Target column '{target_col}' is not numeric: {e}")
+        return False
     
-    # Save to processed folder
-    processed_dir = project_root / "data" / "processed"
-    processed_dir.mkdir(parents=True, exist_ok=True)
+    print(f"Labels shape: {(n_rows, len(columns))}")
     
-    labels_path = processed_dir / "y_train.parquet"
-    y.to_frame(name='target').to_parquet(labels_path, index=False, compression='snappy')
+    unique_vals, counts = merge_value_counts(blocks)
+    if is_binary:
+        unique_vals = [int(value) for value in unique_vals]
+    distribution = counts / counts.sum()
+    
+    # Verify it's binary
+    print(f"Unique values: {unique_vals}")
+    print("Value counts:")
+    for value, count in zip(unique_vals, counts):
+        print(f"  {value}: {count}")
+    print("Class distribution:")
+    for value, share in zip(unique_vals, distribution):
+        print(f"  {value}: {share:.4f}")
+    
+    if not is_binary:
+        print("WARNING: Target column is not binary (0/1)")
     
     print(f"\n✓ Labels saved to: {labels_path}")
-    print(f"  Shape: {y.shape}")
+    print(f"  Shape: ({n_rows},)")
     print(f"  Size: {labels_path.stat().st_size / 1024**2:.2f} MB")
     
     return True
 
 if __name__ == "__main__":
-    success = process_labels()
+    parser = argparse.ArgumentParser(description="Process train labels into data/processed/y_train.parquet.")
+    parser.add_argument('--force', action='store_true',
+                        help="Rebuild the output even if a verified copy already exists")
+    args = parser.parse_args()
+    success = process_labels(force=args.force)
     sys.exit(0 if success else 1)
 
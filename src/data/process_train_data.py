@@ -3,28 +3,127 @@
 Process train data and separate labels from features.
 
 This script:
-1. Loads the training data from data/external/train.parquet
-2. Identifies the target column (label)
-3. Separates features (X) and labels (y)
-4. Saves the processed data to data/processed/
+1. Identifies the target column (label) of data/external/train.parquet
+   from its parquet schema
+2. Separates features (X) and labels (y)
+3. Streams the features to data/processed/, downcast to their narrowest types
+4. Saves the labels and customer IDs to data/processed/
 """
 
+import argparse
+import functools
+import os
 import sys
 from pathlib import Path
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+from pyarrow import compute as pc, csv as pacsv, parquet as papq
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-def load_train_data(data_path):
-    """Load training data from parquet file."""
+from src.utils.file_utils import atomic_output, checksums_ok, source_fingerprint
+
+# Output files written to data/processed/
+FEATURES_FILE = "X_train.parquet"
+LABELS_FILE = "y_train.parquet"
+IDS_FILE = "customer_ids.parquet"
+
+ID_COLUMNS = ['customer_ID', 'id', 'customer_id']
+
+# Rows read, downcast and written per parquet row group when saving features
+ROW_GROUP_SIZE = 200_000
+
+# Candidate integer types for downcasting, narrowest first
+INT_TYPES = (pa.int8(), pa.int16(), pa.int32(), pa.int64())
+
+# Integer columns become pandas nullable integers, so a column holding nulls
+# keeps its integer type instead of becoming float64
+NULLABLE_INT_DTYPES = {
+    pa.int8(): pd.Int8Dtype(), pa.int16(): pd.Int16Dtype(),
+    pa.int32(): pd.Int32Dtype(), pa.int64(): pd.Int64Dtype(),
+    pa.uint8(): pd.UInt8Dtype(), pa.uint16(): pd.UInt16Dtype(),
+    pa.uint32(): pd.UInt32Dtype(), pa.uint64(): pd.UInt64Dtype(),
+}
+
+# Largest magnitude up to which every integer is exactly representable as a float
+MAX_EXACT_FLOAT_INT = 2**53
+
+def find_id_column(columns):
+    """Return the name of the customer ID column, if any."""
+    for col in ID_COLUMNS:
+        if col in columns:
+            return col
+    return None
+
+def load_train_data(data_path, need_ids=True):
+    """Open the training data parquet file for streaming.
+    
+    Returns the open ParquetFile plus the customer IDs as a single-column
+    Arrow table (None if absent or not needed); the features themselves are
+    only read batch by batch when they are saved.
+    """
     print(f"Loading training data from {data_path}...")
-    df = pd.read_parquet(data_path)
-    print(f"Data shape: {df.shape}")
-    print(f"Memory usage: {df.memory_usage(deep=True).sum() / 1024**2:.2f} MB")
-    return df
+    pf = papq.ParquetFile(data_path, memory_map=True)
+    metadata = pf.metadata
+    print(f"Data shape: ({metadata.num_rows}, {metadata.num_columns})")
+    uncompressed = sum(metadata.row_group(i).total_byte_size for i in range(metadata.num_row_groups))
+    print(f"Uncompressed size: {uncompressed / 1024**2:.2f} MB")
+    
+    id_col = find_id_column(pf.schema_arrow.names)
+    ids = pf.read(columns=[id_col], use_threads=True) if id_col and need_ids else None
+    return pf, ids
+
+@functools.lru_cache(maxsize=None)
+def numba_column_stats():
+    """Build the numba kernel for ``column_stats`` on first use (None without numba).
+    
+    numba is imported here rather than at module load, since only the
+    binary-column fallback of ``identify_target_column`` needs it.
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:  # Optional: pip install numba
+        return None
+    
+    @njit(parallel=True, cache=True)
+    def kernel(mat):
+        n_rows, n_cols = mat.shape
+        lo = np.empty(n_cols)
+        hi = np.empty(n_cols)
+        total = np.empty(n_cols)
+        for j in prange(n_cols):
+            mn = np.inf
+            mx = -np.inf
+            s = 0.0
+            for i in range(n_rows):
+                v = mat[i, j]
+                if v != v:
+                    mn = np.nan
+                    mx = np.nan
+                    break
+                if v < mn:
+                    mn = v
+                if v > mx:
+                    mx = v
+                s += v
+            lo[j] = mn
+            hi[j] = mx
+            total[j] = s
+        return lo, hi, total
+    
+    return kernel
+
+def column_stats(mat):
+    """Per-column min, max and sum of a 2D array in one fused pass (NaN poisons min/max)."""
+    kernel = numba_column_stats()
+    if kernel is not None:
+        return kernel(mat)
+    lo = mat.min(axis=0).astype(np.float64)
+    hi = mat.max(axis=0).astype(np.float64)
+    return lo, hi, mat.sum(axis=0, dtype=np.float64)
 
 def check_for_labels_file(external_dir):
     """Check if there's a separate labels file."""
@@ -36,15 +135,29 @@ def check_for_labels_file(external_dir):
         'labels.parquet'
     ]
     
+    # List the directory once instead of a stat() per candidate
+    try:
+        present = {entry.name for entry in os.scandir(external_dir)}
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    
     for label_file in possible_label_files:
-        label_path = external_dir / label_file
-        if label_path.exists():
-            return label_path
+        if label_file in present:
+            return external_dir / label_file
     
     return None
 
-def identify_target_column(df, external_dir=None):
-    """Identify the target column in the dataset."""
+def is_numeric_type(arrow_type):
+    """Check whether an Arrow type holds booleans, integers or floats."""
+    return (pa.types.is_boolean(arrow_type) or pa.types.is_integer(arrow_type)
+            or pa.types.is_floating(arrow_type))
+
+def identify_target_column(data_path, external_dir=None):
+    """Identify the target column of the parquet dataset.
+    
+    Decided from the parquet schema where possible; only the binary-column
+    fallback reads data, and then just the numeric candidate columns.
+    """
     # First check if there's a separate labels file
     if external_dir:
         labels_file = check_for_labels_file(external_dir)
@@ -55,26 +168,46 @@ def identify_target_column(df, external_dir=None):
     # Common target column names in Kaggle competitions
     possible_targets = ['target', 'default', 'label', 'y']
     
+    # A common name settles it from the footer alone, without reading any data
+    schema = papq.read_schema(data_path)
+    columns = set(schema.names)
     for col in possible_targets:
-        if col in df.columns:
+        if col in columns:
             return col
     
     # If no common name found, check for binary columns (0/1)
     # But exclude feature columns (D_, S_, P_, B_, R_)
-    feature_prefixes = ['D_', 'S_', 'P_', 'B_', 'R_']
+    feature_prefixes = ('D_', 'S_', 'P_', 'B_', 'R_')
+    id_columns = set(ID_COLUMNS)
+    candidates = [
+        field.name for field in schema
+        # Skip feature columns, ID columns and non-numeric columns
+        if not (field.name.startswith(feature_prefixes) or field.name in id_columns)
+        and is_numeric_type(field.type)
+    ]
     binary_cols = []
-    for col in df.columns:
-        # Skip feature columns and ID columns
-        if any(col.startswith(p) for p in feature_prefixes) or col in ['customer_ID', 'id', 'customer_id']:
-            continue
-        unique_vals = df[col].unique()
-        if len(unique_vals) <= 2 and set(unique_vals).issubset({0, 1, 0.0, 1.0, -1, -1.0}):
-            # Check if it's a reasonable target distribution (not too imbalanced)
-            val_counts = df[col].value_counts()
-            if len(val_counts) == 2:
-                min_pct = min(val_counts) / len(df)
-                if 0.01 <= min_pct <= 0.5:  # Reasonable target distribution
-                    binary_cols.append(col)
+    table = papq.read_table(data_path, columns=candidates, memory_map=True) if candidates else None
+    if table is not None and table.num_rows > 0:
+        # Contiguous float32 columns (nulls as NaN) for a single min/max/sum
+        # sweep; the exact check below still runs on the original values
+        n = table.num_rows
+        mat = np.empty((n, len(candidates)), dtype=np.float32, order='F')
+        for j, col in enumerate(candidates):
+            mat[:, j] = table.column(col).cast(pa.float32(), safe=False).to_numpy()
+        lo, hi, total = column_stats(mat)
+        del mat
+        
+        # A column holding only lo and hi has (total - n*lo) / (hi - lo) rows equal to hi
+        with np.errstate(divide='ignore', invalid='ignore'):
+            n_hi = (total - n * lo) / (hi - lo)
+        min_pct = np.minimum(n_hi, n - n_hi) / n
+        # Values within [-1, 1] and a reasonable target distribution (not too imbalanced)
+        flagged = (lo >= -1) & (hi <= 1) & (lo < hi) & (min_pct >= 0.01) & (min_pct <= 0.5)
+        
+        for col in [c for c, keep in zip(candidates, flagged) if keep]:
+            unique_vals = np.unique(table.column(col).to_numpy())
+            if len(unique_vals) == 2 and np.isin(unique_vals, [-1, 0, 1]).all():
+                binary_cols.append(col)
     
     if len(binary_cols) == 1:
         return binary_cols[0]
@@ -84,88 +217,166 @@ def identify_target_column(df, external_dir=None):
     print("Note: This appears to be feature-only data. Target may be in a separate file.")
     return None
 
-def separate_features_labels(df, target_col, external_dir=None):
-    """Separate features and labels from the dataframe."""
-    # Get customer ID if it exists (usually first column)
-    id_col = None
-    if 'customer_ID' in df.columns:
-        id_col = 'customer_ID'
-    elif 'id' in df.columns:
-        id_col = 'id'
-    elif 'customer_id' in df.columns:
-        id_col = 'customer_id'
+def separate_features_labels(pf, target_col, ids=None):
+    """Separate the feature columns and the labels of the training data.
+    
+    Returns the names of the feature columns (everything but the customer ID
+    and an in-file target) and the labels as a Series, or None. ``ids`` is the
+    Arrow table of customer IDs from ``load_train_data``; it is used to align
+    a separate labels file.
+    """
+    columns = pf.schema_arrow.names
+    id_col = find_id_column(columns)
+    feature_cols = [c for c in columns if c != id_col]
     
     # Handle separate labels file
     if target_col and isinstance(target_col, Path):
         # Load labels from separate file
-        labels_df = pd.read_parquet(target_col) if target_col.suffix == '.parquet' else pd.read_csv(target_col)
+        labels = papq.read_table(target_col) if target_col.suffix == '.parquet' else pacsv.read_csv(str(target_col))
         # Assume labels are in the first column or match by index
-        if id_col:
-            # Try to merge by ID
-            if id_col in labels_df.columns:
-                y = labels_df.set_index(id_col).iloc[:, 0]
-                ids = df[id_col].copy()
-                # Align labels with features by ID
-                y = y.reindex(df[id_col].values)
-                y = y.values
-            else:
-                # Assume same order
-                y = labels_df.iloc[:, 0].values
-                ids = df[id_col].copy() if id_col else None
+        if ids is not None and id_col in labels.column_names:
+            # Align labels with features by ID: one vectorized hash lookup per
+            # row, giving null (NaN) for customers missing from the labels file
+            label_ids = labels.column(id_col).combine_chunks().cast(ids.schema.field(id_col).type)
+            positions = pc.index_in(ids.column(id_col), value_set=label_ids)
+            value_col = [c for c in labels.column_names if c != id_col][0]
+            y = labels.column(value_col).take(positions)
         else:
             # Assume same order
-            y = labels_df.iloc[:, 0].values
-            ids = None
-    elif target_col and target_col in df.columns:
-        # Target is in the same dataframe
-        y = df[target_col].copy()
-        exclude_cols = [target_col]
-        if id_col:
-            exclude_cols.append(id_col)
-        X = df.drop(columns=exclude_cols).copy()
-        ids = df[id_col].copy() if id_col else None
-        return X, y, ids
+            y = labels.column(0)
+        y = y.to_pandas().rename('target')
+    elif target_col and target_col in columns:
+        # Target is in the same file: read just that column
+        y = pf.read(columns=[target_col]).to_pandas(types_mapper=NULLABLE_INT_DTYPES.get)[target_col]
+        feature_cols.remove(target_col)
     else:
         # No target found - just process features
         print("Warning: No target column found. Processing features only.")
-        exclude_cols = []
-        if id_col:
-            exclude_cols.append(id_col)
-        X = df.drop(columns=exclude_cols).copy() if exclude_cols else df.copy()
         y = None
-        ids = df[id_col].copy() if id_col else None
-        return X, y, ids
     
-    # Separate features (exclude ID columns)
-    exclude_cols = []
-    if id_col:
-        exclude_cols.append(id_col)
+    return feature_cols, y
+
+def narrowest_int_type(lo, hi):
+    """Return the narrowest signed integer type holding [lo, hi], or None."""
+    for int_type in INT_TYPES:
+        info = np.iinfo(int_type.to_pandas_dtype())
+        if info.min <= lo and hi <= info.max:
+            return int_type
+    return None
+
+def plan_feature_types(pf, feature_cols):
+    """Choose the narrowest type of each feature column in one streaming pass.
     
-    X = df.drop(columns=exclude_cols).copy()
+    Integers and whole-number float columns (nulls and NaN aside) get the
+    narrowest integer type holding their range; other float64 columns become
+    float32. Returns the schema the features are written with.
+    """
+    source = pf.schema_arrow
+    numeric = [c for c in feature_cols
+               if pa.types.is_integer(source.field(c).type) or pa.types.is_floating(source.field(c).type)]
+    lo = dict.fromkeys(numeric, np.inf)
+    hi = dict.fromkeys(numeric, -np.inf)
+    whole = dict.fromkeys(numeric, True)
+    if numeric:
+        for batch in pf.iter_batches(batch_size=ROW_GROUP_SIZE, columns=numeric, use_threads=True):
+            for col, array in zip(numeric, batch.columns):
+                if pa.types.is_integer(array.type):
+                    # Exact min/max in Arrow; nulls are skipped
+                    extremes = pc.min_max(array)
+                    if extremes['min'].is_valid:
+                        lo[col] = min(lo[col], extremes['min'].as_py())
+                        hi[col] = max(hi[col], extremes['max'].as_py())
+                    continue
+                # Nulls become NaN, and NaN is treated as missing
+                values = array.to_numpy(zero_copy_only=False)
+                values = values[~np.isnan(values)]
+                if values.size:
+                    lo[col] = min(lo[col], values.min())
+                    hi[col] = max(hi[col], values.max())
+                    whole[col] = whole[col] and bool((values == np.trunc(values)).all())
     
-    # Convert y to Series if it's an array
-    if isinstance(y, np.ndarray):
-        y = pd.Series(y, name='target')
+    fields = []
+    for col in feature_cols:
+        field = source.field(col)
+        if col in numeric and lo[col] <= hi[col]:
+            is_int = pa.types.is_integer(field.type)
+            exact = is_int or (whole[col] and max(-lo[col], hi[col]) <= MAX_EXACT_FLOAT_INT)
+            int_type = narrowest_int_type(lo[col], hi[col]) if exact else None
+            # Never widen: an integer column keeps its type unless a narrower one fits
+            if int_type is not None and not (is_int and int_type.bit_width >= field.type.bit_width):
+                field = field.with_type(int_type)
+        if field.type == pa.float64():
+            field = field.with_type(pa.float32())
+        fields.append(field.remove_metadata())
+    return pa.schema(fields)
+
+def downcast_batch(batch, schema):
+    """Cast a record batch of features to the planned schema."""
+    arrays = []
+    for array, field in zip(batch.columns, schema):
+        if array.type != field.type:
+            if pa.types.is_floating(array.type) and pa.types.is_integer(field.type):
+                # NaN becomes null, as it would in pandas, before the exact cast
+                array = pa.array(array.to_numpy(zero_copy_only=False), from_pandas=True)
+            array = array.cast(field.type)
+        arrays.append(array)
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+def write_features(pf, schema, features_path, **write_options):
+    """Stream the features to parquet one row group at a time, downcast to ``schema``.
     
-    return X, y, ids
+    Only one row group of the training data is in memory at once. Returns the
+    number of rows written and their in-memory (Arrow) size.
+    """
+    n_rows = 0
+    n_bytes = 0
+    with papq.ParquetWriter(features_path, schema, **write_options) as writer:
+        for batch in pf.iter_batches(batch_size=ROW_GROUP_SIZE, columns=schema.names, use_threads=True):
+            batch = downcast_batch(batch, schema)
+            writer.write_batch(batch)
+            n_rows += batch.num_rows
+            n_bytes += batch.nbytes
+    return n_rows, n_bytes
+
+def write_labels(y, labels_path):
+    """Write labels to parquet, storing a binary target as int8 without a dictionary."""
+    values = pa.array(y, from_pandas=True)
+    if y.dropna().isin([0, 1]).all():
+        values = values.cast(pa.int8())
+    table = pa.table({y.name if y.name is not None else 'target': values})
+    papq.write_table(table, labels_path, compression='snappy', use_dictionary=False,
+                     data_page_version='2.0', write_statistics=True)
 
-def save_processed_data(X, y, ids, output_dir):
-    """Save processed features and labels to parquet files."""
+def save_processed_data(pf, schema, y, ids, output_dir, inputs=None):
+    """Save processed features and labels to parquet files.
+    
+    The features are streamed from ``pf`` with the types of ``schema``.
+    ``inputs`` describes what the files were built from; it is recorded in
+    each file's checksum sidecar so later runs can tell whether to rebuild.
+    Returns the row count and in-memory size of the features written.
+    """
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
     
     print(f"\nSaving processed data to {output_dir}...")
     
     # Save features
-    features_path = output_dir / "X_train.parquet"
-    X.to_parquet(features_path, index=False, compression='snappy')
-    print(f"  Features saved: {features_path} ({X.shape})")
+    # Each file is written under a temporary name and renamed into place, so an
+    # interrupted run never leaves a truncated parquet behind
+    features_path = output_dir / FEATURES_FILE
+    # Written once, read on every training run: trade a little write time for
+    # a smaller file with zstd; the small labels file stays on snappy
+    with atomic_output(features_path, inputs) as tmp_path:
+        n_rows, n_bytes = write_features(pf, schema, tmp_path, compression='zstd', compression_level=3,
+                                         use_dictionary=True, data_page_version='2.0')
+    print(f"  Features saved: {features_path} ({(n_rows, len(schema))})")
     
     # Save labels if they exist
     labels_path = None
     if y is not None:
-        labels_path = output_dir / "y_train.parquet"
-        y.to_frame().to_parquet(labels_path, index=False, compression='snappy')
+        labels_path = output_dir / LABELS_FILE
+        with atomic_output(labels_path, inputs) as tmp_path:
+            write_labels(y, tmp_path)
         print(f"  Labels saved: {labels_path} ({y.shape})")
     else:
         print("  Note: No labels to save (target column not found)")
@@ -173,42 +384,65 @@ def save_processed_data(X, y, ids, output_dir):
     # Save IDs if they exist
     ids_path = None
     if ids is not None:
-        ids_path = output_dir / "customer_ids.parquet"
-        ids.to_frame().to_parquet(ids_path, index=False, compression='snappy')
-        print(f"  Customer IDs saved: {ids_path} ({ids.shape})")
+        ids_path = output_dir / IDS_FILE
+        # Dictionary + zstd compresses the repetitive hex IDs far better than snappy
+        with atomic_output(ids_path, inputs) as tmp_path:
+            papq.write_table(ids, tmp_path, compression='zstd', compression_level=3, use_dictionary=True)
+        print(f"  Customer IDs saved: {ids_path} ({ids.num_rows},)")
     
-    return features_path, labels_path, ids_path
+    return n_rows, n_bytes
 
-def print_data_summary(X, y, ids):
+def summarize_data(schema, n_rows, n_bytes, y, ids):
+    """Compute the summary statistics of the processed data.
+    
+    The features are described by their schema and the row count and size
+    counted while they were written, so they are never reread.
+    """
+    summary = {
+        'X_shape': (n_rows, len(schema)),
+        'X_memory': n_bytes,
+        'dtype_counts': pd.Series([str(field.type) for field in schema]).value_counts(),
+    }
+    if y is not None:
+        counts = y.value_counts().sort_index()
+        summary['y_shape'] = y.shape
+        summary['y_counts'] = counts
+        summary['y_distribution'] = (counts / counts.sum()).rename('proportion')
+    if ids is not None:
+        summary['ids_rows'] = ids.num_rows
+        summary['ids_unique'] = pc.count_distinct(ids.column(0)).as_py()
+    return summary
+
+def print_data_summary(summary):
     """Print summary statistics of the processed data."""
     print("\n" + "=" * 70)
     print("DATA SUMMARY")
     print("=" * 70)
     print(f"\nFeatures (X):")
-    print(f"  Shape: {X.shape}")
-    print(f"  Columns: {len(X.columns)}")
-    print(f"  Memory usage: {X.memory_usage(deep=True).sum() / 1024**2:.2f} MB")
+    print(f"  Shape: {summary['X_shape']}")
+    print(f"  Columns: {summary['X_shape'][1]}")
+    print(f"  Memory usage: {summary['X_memory'] / 1024**2:.2f} MB")
     print(f"  Data types:")
-    print(X.dtypes.value_counts())
+    print(summary['dtype_counts'])
     
-    if y is not None:
+    if 'y_counts' in summary:
         print(f"\nLabels (y):")
-        print(f"  Shape: {y.shape}")
+        print(f"  Shape: {summary['y_shape']}")
         print(f"  Value counts:")
-        print(y.value_counts().sort_index())
+        print(summary['y_counts'])
         print(f"  Class distribution:")
-        print(y.value_counts(normalize=True).sort_index())
+        print(summary['y_distribution'])
     else:
         print(f"\nLabels (y): Not available")
     
-    if ids is not None:
+    if 'ids_rows' in summary:
         print(f"\nCustomer IDs:")
-        print(f"  Shape: {ids.shape}")
-        print(f"  Unique IDs: {ids.nunique()}")
+        print(f"  Shape: ({summary['ids_rows']},)")
+        print(f"  Unique IDs: {summary['ids_unique']}")
     
     print("=" * 70)
 
-def main():
+def main(need_ids=True, force=False):
     """Main function to process train data."""
     # Set up paths
     data_dir = project_root / "data"
@@ -224,12 +458,9 @@ def main():
         sys.exit(1)
     
     try:
-        # Load data
-        df = load_train_data(train_path)
-        
-        # Identify target column
+        # Identify target column from the parquet schema before loading anything
         print("\nIdentifying target column...")
-        target_col = identify_target_column(df, external_dir)
+        target_col = identify_target_column(train_path, external_dir)
         
         if target_col:
             if isinstance(target_col, Path):
@@ -239,15 +470,46 @@ def main():
         else:
             print("\nNote: No target column found. Will process features only.")
         
+        # Customer IDs are required to align a separate labels file, so they
+        # are loaded for that even when --no-ids keeps them out of the outputs
+        load_ids = need_ids or isinstance(target_col, Path)
+        
+        # Outputs built by this script from the same train data and target make
+        # this a no-op; process_labels writes a customer-level y_train of its own
+        inputs = {
+            'script': 'process_train_data',
+            'train_file': source_fingerprint(train_path),
+            'target': target_col if isinstance(target_col, str) else None,
+            'labels_file': source_fingerprint(target_col) if isinstance(target_col, Path) else None,
+        }
+        outputs = [processed_dir / FEATURES_FILE]
+        if target_col:
+            outputs.append(processed_dir / LABELS_FILE)
+        if need_ids:
+            outputs.append(processed_dir / IDS_FILE)
+        if not force and checksums_ok(outputs, inputs):
+            print(f"Train data already processed in {processed_dir} (checksums and inputs verified)")
+            print("Run with --force to rebuild it.")
+            return True
+        
+        # Open the data, reading only the customer IDs up front
+        pf, ids = load_train_data(train_path, need_ids=load_ids)
+        
         # Separate features and labels
         print("\nSeparating features and labels...")
-        X, y, ids = separate_features_labels(df, target_col, external_dir)
+        feature_cols, y = separate_features_labels(pf, target_col, ids)
+        if not need_ids:
+            ids = None
         
-        # Print summary
-        print_data_summary(X, y, ids)
+        # Halve the width of the features as they are streamed to disk
+        print("\nPlanning feature types...")
+        schema = plan_feature_types(pf, feature_cols)
         
         # Save processed data
-        save_processed_data(X, y, ids, processed_dir)
+        n_rows, n_bytes = save_processed_data(pf, schema, y, ids, processed_dir, inputs)
+        
+        # Print summary
+        print_data_summary(summarize_data(schema, n_rows, n_bytes, y, ids))
         
         print("\n" + "=" * 70)
         print("SUCCESS: Train data processed and saved!")
@@ -271,6 +533,12 @@ def main():
         return False
 
 if __name__ == "__main__":
-    success = main()
+    parser = argparse.ArgumentParser(description="Process train data and separate labels from features.")
+    parser.add_argument('--no-ids', action='store_true',
+                        help="Skip reading and saving customer IDs")
+    parser.add_argument('--force', action='store_true',
+                        help="Rebuild the outputs even if verified copies already exist")
+    args = parser.parse_args()
+    success = main(need_ids=not args.no_ids, force=args.force)
     sys.exit(0 if success else 1)
 
@@ -0,0 +1,121 @@
+"""
+Helpers for writing processed data files safely.
+
+Outputs are written to a uniquely named temporary file next to their final
+path and moved into place with an atomic rename, so an interrupted run never
+leaves a truncated parquet behind and concurrent runs never share a
+temporary file. A JSON sidecar (``<name>.sha256.json``) records the
+file's SHA-256 together with a description of the inputs it was built from,
+so later runs can skip rebuilding a file only when it is complete and was
+produced from the same inputs.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+# Read size used when hashing files
+HASH_CHUNK_SIZE = 1 << 20
+
+def checksum_path(path):
+    """Return the path of the checksum sidecar file for a file."""
+    path = Path(path)
+    return path.with_name(path.name + ".sha256.json")
+
+def file_sha256(path):
+    """Compute the SHA-256 hex digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def source_fingerprint(path):
+    """Describe an input file by its resolved path, size and modification time."""
+    path = Path(path)
+    st = path.stat()
+    return {"path": str(path.resolve()), "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+def temp_path_for(path):
+    """Create an empty, uniquely named temporary file next to ``path``."""
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    os.close(fd)
+    # mkstemp creates the file as 0600; give it the mode a plain open() would
+    umask = os.umask(0)
+    os.umask(umask)
+    os.chmod(tmp_path, 0o666 & ~umask)
+    return Path(tmp_path)
+
+def write_checksum(path, inputs=None, sha256=None):
+    """Write the checksum sidecar for a file, recording the inputs it came from.
+    
+    ``sha256`` is the file's digest if already known; otherwise it is computed.
+    The sidecar itself is replaced atomically, so readers never see it half written.
+    """
+    path = Path(path)
+    if sha256 is None:
+        sha256 = file_sha256(path)
+    record = {"file": path.name, "sha256": sha256, "inputs": inputs}
+    sidecar = checksum_path(path)
+    tmp_path = temp_path_for(sidecar)
+    try:
+        tmp_path.write_text(json.dumps(record, indent=2, sort_keys=True) + "\n")
+        os.replace(tmp_path, sidecar)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+def read_checksum(path, inputs=None):
+    """Return the sidecar record of a file if it was built from ``inputs``, else None."""
+    try:
+        record = json.loads(checksum_path(path).read_text())
+    except (FileNotFoundError, NotADirectoryError, ValueError):
+        return None
+    # Round-trip through JSON so tuples and lists compare equal
+    if not isinstance(record, dict) or record.get("inputs") != json.loads(json.dumps(inputs)):
+        return None
+    return record
+
+def checksums_ok(paths, inputs=None):
+    """Check that every file is complete and was built from the given inputs.
+    
+    ``inputs`` must be JSON-serializable and is compared with the value stored
+    by ``write_checksum`` for all files before any (expensive) hash is checked,
+    and the files are then hashed smallest first.
+    """
+    records = []
+    for path in map(Path, paths):
+        record = read_checksum(path, inputs)
+        if record is None:
+            return False
+        try:
+            size = path.stat().st_size
+        except (FileNotFoundError, NotADirectoryError):
+            return False
+        records.append((size, str(path), record))
+    return all(file_sha256(path) == record.get("sha256")
+               for _, path, record in sorted(records, key=lambda r: r[:2]))
+
+def checksum_ok(path, inputs=None):
+    """Check that a file is complete and was built from the given inputs."""
+    return checksums_ok([path], inputs)
+
+@contextmanager
+def atomic_output(path, inputs=None):
+    """Yield a temporary path to write to; it replaces ``path`` only on success."""
+    path = Path(path)
+    tmp_path = temp_path_for(path)
+    try:
+        yield tmp_path
+        # Hash the file under its private name, before anyone else can replace it
+        sha256 = file_sha256(tmp_path)
+        # Drop the old sidecar first so a crash before the new one is written
+        # reads as "not verified" rather than as a stale match
+        checksum_path(path).unlink(missing_ok=True)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    write_checksum(path, inputs, sha256)